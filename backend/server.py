@@ -1,7 +1,12 @@
 from fastapi import FastAPI, APIRouter, BackgroundTasks, HTTPException
+from fastapi.responses import JSONResponse
+import orjson
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 import os
 import logging
 from pathlib import Path
@@ -9,34 +14,69 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
-import smtplib
+from selectolax.parser import HTMLParser
+import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import schedule
-import time
-from threading import Thread
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 import pytz
 from urllib.parse import quote
 import re
 import json
+import html
+
+# Use uvloop for the event loop; everything here is async network I/O,
+# so the libuv loop helps every endpoint and the scheduler alike
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    # uvloop is POSIX-only; fall back to the default loop elsewhere
+    pass
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection; keep a warm pool and compress bulk payloads on
+# the wire (falls back to zlib where zstd isn't available)
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=50,
+    minPoolSize=10,
+    compressors='zstd,zlib',
+    zlibCompressionLevel=6,
+    retryWrites=True
+)
 db = client[os.environ['DB_NAME']]
 
+# Raw-BSON view of the jobs collection for bulk reads: documents come
+# back as undecoded bytes instead of eagerly materialized dicts.
+# Writes needing _id generation keep using db.jobs.
+jobs_raw = db.get_collection(
+    'jobs', codec_options=CodecOptions(document_class=RawBSONDocument)
+)
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse backed by orjson, which serializes job lists and
+    datetimes much faster than the stdlib encoder"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NAIVE_UTC)
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+# Shared HTTP session, created on startup and closed on shutdown
+_http_session: Optional[aiohttp.ClientSession] = None
+
 # Email configuration
 EMAIL_ADDRESS = "ananya4bh@gmail.com"
 EMAIL_PASSWORD = os.environ.get('GMAIL_APP_PASSWORD', 'tcmb wjfk uyxa bxzm')
@@ -78,11 +118,138 @@ class JobSearchResult(BaseModel):
     search_query: str
     search_date: datetime
 
+class JobSearchResultSummary(BaseModel):
+    # Optional because documents written before the jobs collection split
+    # have no search_id
+    search_id: Optional[str] = None
+    total_count: int
+    search_query: str
+    search_date: datetime
+
+# Precompiled patterns and constant filter sets, built once at import
+# instead of per scraped job
+_COMPANY_RE = re.compile(r'at\s+([A-Za-z\s&.]+)')
+
+_RELEVANT_KEYWORDS = frozenset(
+    ['risk', 'compliance', 'vendor', 'supplier', 'third party', 'tprm']
+)
+
+def _is_relevant(job_title: str) -> bool:
+    """Whether a job title matches any of the relevance keywords"""
+    title_lc = job_title.lower()
+    return any(keyword in title_lc for keyword in _RELEVANT_KEYWORDS)
+
+_BASE_KEYWORDS = (
+    "Third Party Risk Management",
+    "Vendor Risk Assessment",
+    "Supplier Risk Analysis",
+    "Risk Mitigation",
+    "Compliance Management"
+)
+
+_BASE_SKILLS = (
+    "GRC Tools (Archer, ServiceNow)",
+    "Risk Assessment Frameworks",
+    "SQL and Data Analysis",
+    "Excel/Advanced Analytics",
+    "Regulatory Compliance (SOX, GDPR)"
+)
+
+# SERP bodies run to hundreds of KB; everything we extract sits in the
+# first part of the page, so cap how much of each response we buffer
+_MAX_BODY_BYTES = 512 * 1024
+
+async def _read_capped(response) -> bytes:
+    """Read a response body in chunks, stopping at _MAX_BODY_BYTES"""
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(16384):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= _MAX_BODY_BYTES:
+            break
+    return b"".join(chunks)
+
+def _normalize_link(job_link: str) -> str:
+    """Canonical form of a job link for deduplication"""
+    return job_link.split('?')[0].rstrip('/').lower()
+
 # Job search and scraping functions
-async def search_jobs_google(query: str, location: str = "India", days_filter: int = 7) -> List[JobListing]:
-    """Search for jobs using Google search with briansjobsearch patterns"""
+async def _fetch_one(search_query: str, query: str, sem: asyncio.Semaphore) -> List[dict]:
+    """Fetch and parse a single Google search results page"""
     jobs = []
-    
+    async with sem:
+        try:
+            # Use Google search API or scrape Google results
+            google_url = f"https://www.google.com/search?q={quote(search_query)}&tbm=nws"
+
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            }
+
+            async with _http_session.get(google_url, headers=headers) as response:
+                if response.status == 200:
+                    # selectolax detects the encoding itself, so hand it
+                    # the raw bytes and skip the Python-level decode
+                    raw = await _read_capped(response)
+                    tree = HTMLParser(raw)
+
+                    # Extract job listings from search results
+                    job_results = tree.css('div.g')
+
+                    for result in job_results[:10]:  # Limit to first 10 results per query
+                        try:
+                            title_elem = result.css_first('h3')
+                            link_elem = result.css_first('a')
+
+                            if title_elem and link_elem:
+                                job_title = title_elem.text()
+                                job_link = link_elem.attributes.get('href')
+                                # selectolax maps missing/valueless href
+                                # attributes to None; skip those results
+                                if not job_link:
+                                    continue
+
+                                # Extract company name (basic pattern)
+                                company_name = "Company Name Not Found"
+                                desc_elem = result.css_first('span.st')
+                                if desc_elem:
+                                    desc_text = desc_elem.text()
+                                    # Try to extract company name patterns
+                                    company_match = _COMPANY_RE.search(desc_text)
+                                    if company_match:
+                                        company_name = company_match.group(1).strip()
+
+                                # Generate relevant keywords and skills
+                                keywords = generate_keywords(job_title, query)
+                                technical_skills = generate_technical_skills(job_title, query)
+
+                                # Plain dict matching the JobListing schema;
+                                # it goes straight to insert_many without a
+                                # second materialization through Pydantic
+                                jobs.append({
+                                    "id": str(uuid.uuid4()),
+                                    "job_title": job_title,
+                                    "company_name": company_name,
+                                    "job_link": job_link,
+                                    "location": "Bangalore, India / Remote",
+                                    "keywords": list(keywords),
+                                    "technical_skills": list(technical_skills),
+                                    "posted_date": "Recent (7 days)",
+                                    "source": "google_search",
+                                    "scraped_at": datetime.utcnow()
+                                })
+                        except Exception as e:
+                            logger.error(f"Error parsing job result: {e}")
+                            continue
+
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+
+    return jobs
+
+async def search_jobs_google(query: str, location: str = "India", days_filter: int = 7) -> List[dict]:
+    """Search for jobs using Google search with briansjobsearch patterns"""
     # Multiple search variations for better results - including remote positions
     search_queries = [
         f'"{query}" jobs in Bangalore India OR remote site:linkedin.com OR site:naukri.com OR site:indeed.com',
@@ -92,121 +259,75 @@ async def search_jobs_google(query: str, location: str = "India", days_filter: i
         f'"Third Party Risk" remote jobs India product company',
         f'"Vendor Risk Management" remote OR Bangalore India jobs'
     ]
-    
-    async with aiohttp.ClientSession() as session:
-        for search_query in search_queries:
-            try:
-                # Use Google search API or scrape Google results
-                google_url = f"https://www.google.com/search?q={quote(search_query)}&tbm=nws"
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                
-                async with session.get(google_url, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Extract job listings from search results
-                        job_results = soup.find_all('div', class_='g')
-                        
-                        for result in job_results[:10]:  # Limit to first 10 results per query
-                            try:
-                                title_elem = result.find('h3')
-                                link_elem = result.find('a')
-                                
-                                if title_elem and link_elem:
-                                    job_title = title_elem.get_text()
-                                    job_link = link_elem.get('href')
-                                    
-                                    # Extract company name (basic pattern)
-                                    company_name = "Company Name Not Found"
-                                    desc_elem = result.find('span', class_='st')
-                                    if desc_elem:
-                                        desc_text = desc_elem.get_text()
-                                        # Try to extract company name patterns
-                                        company_match = re.search(r'at\s+([A-Za-z\s&.]+)', desc_text)
-                                        if company_match:
-                                            company_name = company_match.group(1).strip()
-                                    
-                                    # Generate relevant keywords and skills
-                                    keywords = generate_keywords(job_title, query)
-                                    technical_skills = generate_technical_skills(job_title, query)
-                                    
-                                    job = JobListing(
-                                        job_title=job_title,
-                                        company_name=company_name,
-                                        job_link=job_link,
-                                        location="Bangalore, India / Remote",
-                                        keywords=keywords,
-                                        technical_skills=technical_skills,
-                                        posted_date="Recent (7 days)",
-                                        source="google_search"
-                                    )
-                                    jobs.append(job)
-                            except Exception as e:
-                                logger.error(f"Error parsing job result: {e}")
-                                continue
-                        
-                        # Add a small delay between requests
-                        await asyncio.sleep(1)
-                        
-            except Exception as e:
-                logger.error(f"Error searching jobs: {e}")
+
+    # Fan the queries out concurrently; the semaphore caps how many
+    # requests hit Google at once
+    sem = asyncio.Semaphore(3)
+    results = await asyncio.gather(
+        *[_fetch_one(q, query, sem) for q in search_queries],
+        return_exceptions=True
+    )
+
+    # The queries overlap heavily, so the same posting often surfaces
+    # more than once; keep only the first hit per canonical link
+    jobs = []
+    seen = set()
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error searching jobs: {result}")
+            continue
+        for job in result:
+            key = _normalize_link(job["job_link"])
+            if key in seen:
                 continue
-    
+            seen.add(key)
+            jobs.append(job)
+
     return jobs
 
-def generate_keywords(job_title: str, query: str) -> List[str]:
-    """Generate relevant keywords for resume optimization"""
-    base_keywords = [
-        "Third Party Risk Management",
-        "Vendor Risk Assessment",
-        "Supplier Risk Analysis",
-        "Risk Mitigation",
-        "Compliance Management"
-    ]
-    
+def _title_flags(job_title: str) -> int:
+    """Reduce a job title to the bitmask of role markers the keyword and
+    skill generators actually discriminate on"""
+    t = job_title.lower()
+    return ('senior' in t) | (('analyst' in t) << 1) | (('manager' in t) << 2)
+
+@lru_cache(maxsize=8)
+def _keywords_for(flags: int) -> tuple:
+    keywords = list(_BASE_KEYWORDS)
+
     # Add context-specific keywords based on job title
-    if "senior" in job_title.lower():
-        base_keywords.extend(["Senior Risk Analyst", "Risk Leadership"])
-    if "analyst" in job_title.lower():
-        base_keywords.extend(["Risk Analysis", "Data Analysis"])
-    if "manager" in job_title.lower():
-        base_keywords.extend(["Risk Management", "Team Leadership"])
-    
-    return base_keywords[:5]
-
-def generate_technical_skills(job_title: str, query: str) -> List[str]:
-    """Generate technical skills typically required for the role"""
-    technical_skills = [
-        "GRC Tools (Archer, ServiceNow)",
-        "Risk Assessment Frameworks",
-        "SQL and Data Analysis",
-        "Excel/Advanced Analytics",
-        "Regulatory Compliance (SOX, GDPR)"
-    ]
-    
+    if flags & 1:
+        keywords.extend(["Senior Risk Analyst", "Risk Leadership"])
+    if flags & 2:
+        keywords.extend(["Risk Analysis", "Data Analysis"])
+    if flags & 4:
+        keywords.extend(["Risk Management", "Team Leadership"])
+
+    return tuple(keywords[:5])
+
+@lru_cache(maxsize=8)
+def _skills_for(flags: int) -> tuple:
+    technical_skills = list(_BASE_SKILLS)
+
     # Add role-specific technical skills
-    if "senior" in job_title.lower():
+    if flags & 1:
         technical_skills.extend(["Risk Modeling", "Quantitative Analysis"])
-    if "analyst" in job_title.lower():
+    if flags & 2:
         technical_skills.extend(["Python/R", "Business Intelligence"])
-    
-    return technical_skills[:5]
 
-async def send_email_report(jobs: List[JobListing], recipient_email: str):
-    """Send email with job search results in tabular format"""
-    try:
-        # Create email content
-        msg = MIMEMultipart()
-        msg['From'] = EMAIL_ADDRESS
-        msg['To'] = recipient_email
-        msg['Subject'] = EMAIL_SUBJECT
-        
-        # Create HTML table
-        html_content = f"""
+    return tuple(technical_skills[:5])
+
+def generate_keywords(job_title: str, query: str) -> tuple:
+    """Generate relevant keywords for resume optimization"""
+    return _keywords_for(_title_flags(job_title))
+
+def generate_technical_skills(job_title: str, query: str) -> tuple:
+    """Generate technical skills typically required for the role"""
+    return _skills_for(_title_flags(job_title))
+
+# Static parts of the HTML report, built once at import; only the row
+# fragments and the header date/count are formatted per email
+_REPORT_HEAD_TMPL = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -235,8 +356,8 @@ async def send_email_report(jobs: List[JobListing], recipient_email: str):
             </style>
         </head>
         <body>
-            <h2>TPRM Job Search Results - {datetime.now().strftime('%Y-%m-%d')}</h2>
-            <p>Found {len(jobs)} relevant Third Party Risk Assessment jobs in Bangalore, India & Remote positions</p>
+            <h2>TPRM Job Search Results - {date}</h2>
+            <p>Found {count} relevant Third Party Risk Assessment jobs in Bangalore, India & Remote positions</p>
             
             <table>
                 <tr>
@@ -247,23 +368,18 @@ async def send_email_report(jobs: List[JobListing], recipient_email: str):
                     <th>5 Technical Skills</th>
                 </tr>
         """
-        
-        for job in jobs:
-            # Ensure we have exactly 5 keywords and skills
-            keywords_str = ", ".join(job.keywords[:5])
-            skills_str = ", ".join(job.technical_skills[:5])
-            
-            html_content += f"""
+
+_ROW_TMPL = """
                 <tr>
-                    <td>{job.job_title}</td>
-                    <td>{job.company_name}</td>
-                    <td><a href="{job.job_link}" target="_blank">View Job</a></td>
-                    <td class="keywords">{keywords_str}</td>
-                    <td class="skills">{skills_str}</td>
+                    <td>{title}</td>
+                    <td>{company}</td>
+                    <td><a href="{link}" target="_blank">View Job</a></td>
+                    <td class="keywords">{keywords}</td>
+                    <td class="skills">{skills}</td>
                 </tr>
             """
-        
-        html_content += """
+
+_REPORT_TAIL = """
             </table>
             
             <p><strong>Note:</strong> Jobs are filtered for recent postings (last 7 days) and focus on Third Party Risk, Vendor Risk, and Supplier Risk Assessment roles in Bangalore and remote positions for product companies.</p>
@@ -273,17 +389,52 @@ async def send_email_report(jobs: List[JobListing], recipient_email: str):
         </body>
         </html>
         """
+
+async def send_email_report(jobs: List[dict], recipient_email: str):
+    """Send email with job search results in tabular format"""
+    try:
+        # Create email content
+        msg = MIMEMultipart()
+        msg['From'] = EMAIL_ADDRESS
+        msg['To'] = recipient_email
+        msg['Subject'] = EMAIL_SUBJECT
         
+        # Collect chunks and join once so building the body stays linear
+        # in the number of jobs
+        parts = [_REPORT_HEAD_TMPL.format_map({
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'count': len(jobs)
+        })]
+        for job in jobs:
+            # Ensure we have exactly 5 keywords and skills
+            keywords_str = ", ".join(job["keywords"][:5])
+            skills_str = ", ".join(job["technical_skills"][:5])
+
+            parts.append(_ROW_TMPL.format(
+                title=html.escape(job["job_title"]),
+                company=html.escape(job["company_name"]),
+                link=html.escape(job["job_link"], quote=True),
+                keywords=html.escape(keywords_str),
+                skills=html.escape(skills_str)
+            ))
+
+        parts.append(_REPORT_TAIL)
+
+        html_content = "".join(parts)
+
         msg.attach(MIMEText(html_content, 'html'))
         
-        # Send email
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-        server.starttls()
-        server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
-        text = msg.as_string()
-        server.sendmail(EMAIL_ADDRESS, recipient_email, text)
-        server.quit()
-        
+        # Send email without blocking the event loop
+        await aiosmtplib.send(
+            msg,
+            hostname='smtp.gmail.com',
+            port=587,
+            start_tls=True,
+            username=EMAIL_ADDRESS,
+            password=EMAIL_PASSWORD,
+            timeout=30
+        )
+
         logger.info(f"Email sent successfully to {recipient_email}")
         return True
         
@@ -304,21 +455,25 @@ async def daily_job_search_task():
         )
         
         # Filter for relevant jobs (basic filtering)
-        relevant_jobs = []
-        for job in jobs:
-            if any(keyword in job.job_title.lower() for keyword in 
-                   ['risk', 'compliance', 'vendor', 'supplier', 'third party', 'tprm']):
-                relevant_jobs.append(job)
-        
-        # Store results in database
-        job_search_result = JobSearchResult(
-            jobs=relevant_jobs,
-            total_count=len(relevant_jobs),
-            search_query="Third Party Risk Assessment",
-            search_date=datetime.utcnow()
-        )
+        relevant_jobs = [
+            job for job in jobs
+            if _is_relevant(job["job_title"])
+        ]
         
-        await db.job_search_results.insert_one(job_search_result.dict())
+        # Store a summary doc plus one document per job so result sets
+        # stay small and indexable as they grow
+        search_id = str(uuid.uuid4())
+        await db.job_search_results.insert_one({
+            "search_id": search_id,
+            "total_count": len(relevant_jobs),
+            "search_query": "Third Party Risk Assessment",
+            "search_date": datetime.utcnow()
+        })
+
+        if relevant_jobs:
+            docs = [{**job, "search_id": search_id} for job in relevant_jobs]
+            # ordered=False so one bad doc doesn't abort the batch
+            await db.jobs.insert_many(docs, ordered=False)
         
         # Send email report
         await send_email_report(relevant_jobs, EMAIL_ADDRESS)
@@ -329,23 +484,12 @@ async def daily_job_search_task():
         logger.error(f"Daily job search task failed: {e}")
 
 # Scheduler setup
-def schedule_daily_jobs():
-    """Schedule daily job search at 9 AM IST"""
-    ist = pytz.timezone('Asia/Kolkata')
-    
-    def job_wrapper():
-        asyncio.run(daily_job_search_task())
-    
-    schedule.every().day.at("09:00").do(job_wrapper)
-    
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
-
-# Start scheduler in background thread
-def start_scheduler():
-    scheduler_thread = Thread(target=schedule_daily_jobs, daemon=True)
-    scheduler_thread.start()
+def start_scheduler() -> AsyncIOScheduler:
+    """Schedule daily job search at 9 AM IST on the main event loop"""
+    scheduler = AsyncIOScheduler(timezone=pytz.timezone('Asia/Kolkata'))
+    scheduler.add_job(daily_job_search_task, 'cron', hour=9, minute=0)
+    scheduler.start()
+    return scheduler
 
 # API Routes
 @api_router.get("/")
@@ -363,11 +507,10 @@ async def search_jobs_endpoint(request: JobSearchRequest):
         )
         
         # Filter for relevant jobs
-        relevant_jobs = []
-        for job in jobs:
-            if any(keyword in job.job_title.lower() for keyword in 
-                   ['risk', 'compliance', 'vendor', 'supplier', 'third party', 'tprm']):
-                relevant_jobs.append(job)
+        relevant_jobs = [
+            job for job in jobs
+            if _is_relevant(job["job_title"])
+        ]
         
         return {
             "jobs": relevant_jobs,
@@ -380,11 +523,12 @@ async def search_jobs_endpoint(request: JobSearchRequest):
         logger.error(f"Job search failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@api_router.post("/send-test-email")
-async def send_test_email():
+@api_router.post("/send-test-email", status_code=202)
+async def send_test_email(background_tasks: BackgroundTasks):
     """Send test email with sample job data"""
     try:
-        # Create sample job data
+        # Create sample job data; validate through JobListing once, then
+        # hand plain dicts to the report builder
         sample_jobs = [
             JobListing(
                 job_title="Senior Third Party Risk Analyst",
@@ -393,7 +537,7 @@ async def send_test_email():
                 location="Bangalore, India / Remote",
                 keywords=["Third Party Risk Management", "Vendor Risk Assessment", "Compliance", "Risk Mitigation", "GRC"],
                 technical_skills=["GRC Tools", "SQL", "Risk Frameworks", "Excel", "Regulatory Compliance"]
-            ),
+            ).dict(),
             JobListing(
                 job_title="Vendor Risk Manager - Remote",
                 company_name="Product Company Ltd",
@@ -401,40 +545,71 @@ async def send_test_email():
                 location="Remote / Bangalore, India",
                 keywords=["Vendor Risk", "Supplier Management", "Risk Assessment", "Compliance", "Due Diligence"],
                 technical_skills=["ServiceNow", "Risk Modeling", "Python", "Business Intelligence", "SOX Compliance"]
-            )
+            ).dict()
         ]
         
-        success = await send_email_report(sample_jobs, EMAIL_ADDRESS)
-        
-        if success:
-            return {"message": "Test email sent successfully"}
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send test email")
-            
+        background_tasks.add_task(send_email_report, sample_jobs, EMAIL_ADDRESS)
+        return {"message": "Test email scheduled"}
+
     except Exception as e:
         logger.error(f"Test email failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@api_router.get("/job-results", response_model=List[JobSearchResult])
+@api_router.get("/job-results", response_model=List[JobSearchResultSummary])
 async def get_job_results():
-    """Get recent job search results"""
+    """Get summaries of recent job searches"""
     try:
-        results = await db.job_search_results.find().sort("search_date", -1).limit(10).to_list(10)
-        return [JobSearchResult(**result) for result in results]
+        results = await db.job_search_results.find({}, {"_id": 0, "jobs": 0}).sort("search_date", -1).limit(10).to_list(10)
+        # Data straight out of our own collection is already valid;
+        # model_construct skips revalidating every document
+        return [JobSearchResultSummary.model_construct(**result) for result in results]
     except Exception as e:
         logger.error(f"Failed to get job results: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@api_router.post("/trigger-manual-search")
-async def trigger_manual_search():
-    """Manually trigger the daily job search"""
+@api_router.get("/job-results/{search_id}")
+async def get_job_result_detail(search_id: str):
+    """Get a single search result with its full job list"""
     try:
-        await daily_job_search_task()
-        return {"message": "Manual job search completed successfully"}
+        summary = await db.job_search_results.find_one({"search_id": search_id}, {"_id": 0})
+        if not summary:
+            raise HTTPException(status_code=404, detail="Search result not found")
+
+        raw_docs = await jobs_raw.find({"search_id": search_id}, {"_id": 0}).to_list(None)
+        summary["jobs"] = [bson.decode(doc.raw) for doc in raw_docs]
+        return summary
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Manual job search failed: {e}")
+        logger.error(f"Failed to get job result detail: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@api_router.get("/jobs/recent")
+async def get_recent_jobs(hours: int = 24):
+    """Get relevant jobs stored in the last N hours, filtered server-side"""
+    try:
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        pipeline = [
+            {"$match": {
+                "$text": {"$search": "risk compliance vendor supplier tprm"},
+                "scraped_at": {"$gte": cutoff}
+            }},
+            {"$sort": {"scraped_at": -1}},
+            {"$limit": 100},
+            {"$project": {"_id": 0}}
+        ]
+        jobs = await db.jobs.aggregate(pipeline).to_list(100)
+        return {"jobs": jobs, "total_count": len(jobs)}
+    except Exception as e:
+        logger.error(f"Failed to get recent jobs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@api_router.post("/trigger-manual-search", status_code=202)
+async def trigger_manual_search(background_tasks: BackgroundTasks):
+    """Manually trigger the daily job search without holding the request open"""
+    background_tasks.add_task(daily_job_search_task)
+    return {"message": "Manual job search scheduled; poll /job-results for the outcome"}
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -448,10 +623,22 @@ app.add_middleware(
 
 @app.on_event("startup")
 async def startup_event():
-    """Start the scheduler when the app starts"""
-    start_scheduler()
+    """Start the scheduler and shared HTTP session when the app starts"""
+    global _http_session
+    _http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=20)
+    )
+    await db.jobs.create_index("search_id")
+    await db.jobs.create_index([("job_title", "text")])
+    await db.jobs.create_index("scraped_at")
+    await db.job_search_results.create_index("search_date")
+    app.state.scheduler = start_scheduler()
     logger.info("TPRM Job Search System started with daily scheduler at 9 AM IST")
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    app.state.scheduler.shutdown()
+    if _http_session:
+        await _http_session.close()
     client.close()
\ No newline at end of file
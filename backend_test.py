@@ -128,19 +128,19 @@ def test_email_functionality():
     try:
         response = requests.post(f"{API_BASE}/send-test-email", timeout=15)
         print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
+
+        if response.status_code == 202:
             data = response.json()
             print(f"Response: {json.dumps(data, indent=2)}")
-            
-            if "message" in data and "successfully" in data["message"].lower():
+
+            if "message" in data and "scheduled" in data["message"].lower():
                 print("✅ PASS: Email functionality working")
                 return True
             else:
                 print("❌ FAIL: Unexpected response message")
                 return False
         else:
-            print(f"❌ FAIL: Expected 200, got {response.status_code}")
+            print(f"❌ FAIL: Expected 202, got {response.status_code}")
             print(f"Response: {response.text}")
             return False
             
@@ -154,22 +154,22 @@ def test_manual_search_trigger():
     print("-" * 30)
     
     try:
-        print("Triggering manual search (this may take 30+ seconds)...")
+        print("Triggering manual search (runs in the background)...")
         response = requests.post(f"{API_BASE}/trigger-manual-search", timeout=60)
         print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
+
+        if response.status_code == 202:
             data = response.json()
             print(f"Response: {json.dumps(data, indent=2)}")
-            
-            if "message" in data and "completed" in data["message"].lower():
+
+            if "message" in data and "scheduled" in data["message"].lower():
                 print("✅ PASS: Manual search trigger working")
                 return True
             else:
                 print("❌ FAIL: Unexpected response message")
                 return False
         else:
-            print(f"❌ FAIL: Expected 200, got {response.status_code}")
+            print(f"❌ FAIL: Expected 202, got {response.status_code}")
             print(f"Response: {response.text}")
             return False
             
@@ -193,7 +193,9 @@ def test_job_results_storage():
             if isinstance(data, list):
                 if data:
                     sample_result = data[0]
-                    required_fields = ['jobs', 'total_count', 'search_query', 'search_date']
+                    # /job-results returns summaries; full job lists live
+                    # under /job-results/{search_id}
+                    required_fields = ['total_count', 'search_query', 'search_date']
                     missing_fields = [field for field in required_fields if field not in sample_result]
                     
                     if missing_fields: